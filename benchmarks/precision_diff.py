@@ -0,0 +1,71 @@
+"""
+Renders a scene in float64 and float32 precision and compares the two images, to confirm the reduced precision
+mode doesn't introduce artifacts (e.g. shadow acne from self-intersection).
+
+Both renders use the same seed so their shadow samples match. Exits with a non-zero status if the images differ
+by more than the given thresholds.
+
+    python benchmarks/precision_diff.py src/scenes/pool.txt --width 120 --height 80
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAY_TRACER = os.path.join(ROOT, "src", "ray_tracer.py")
+
+
+def render(scene_path: str, output_path: str, precision: str, width: int, height: int, seed: int) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, RAY_TRACER, scene_path, output_path, "--width", str(width), "--height", str(height),
+         "--precision", precision, "--seed", str(seed), "--no-progress"],
+        stdout=subprocess.DEVNULL, check=True
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare float32 and float64 renders')
+    parser.add_argument('scene_file', type=str, help='Path to the scene file')
+    parser.add_argument('--width', type=int, default=120, help='Image width')
+    parser.add_argument('--height', type=int, default=80, help='Image height')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed shared by both renders')
+    parser.add_argument('--min-psnr', type=float, default=40.0, help='Minimum allowed PSNR in dB')
+    parser.add_argument('--max-bad-pixels', type=float, default=0.001,
+                        help='Maximum allowed fraction of pixels off by more than 8/255 in any channel')
+    parser.add_argument('--diff-image', type=str, default=None, help='Save an amplified difference image here')
+    args = parser.parse_args()
+
+    images = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for precision in ("float64", "float32"):
+            output_path = os.path.join(tmp, f"{precision}.png")
+            elapsed = render(args.scene_file, output_path, precision, args.width, args.height, args.seed)
+            print(f"{precision}: rendered in {elapsed:.2f} s")
+            images[precision] = np.asarray(Image.open(output_path).convert("RGB"), dtype=np.float64)
+
+    diff = np.abs(images["float64"] - images["float32"])
+    mse = np.mean(diff ** 2)
+    psnr = np.inf if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+    bad_pixels = np.mean(diff.max(axis=-1) > 8)
+
+    print(f"Max difference: {diff.max():.0f}/255, mean difference: {diff.mean():.3f}/255")
+    print(f"PSNR: {psnr:.1f} dB (min {args.min_psnr:.1f}), pixels off by > 8/255: {bad_pixels:.3%}")
+
+    if args.diff_image is not None:
+        Image.fromarray(np.uint8(np.clip(diff * 8, 0, 255))).save(args.diff_image)
+
+    if psnr < args.min_psnr or bad_pixels > args.max_bad_pixels:
+        print("float32 render differs too much from the float64 render")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures ray_tracer.py startup on a thumbnail sized scene, where process startup rather than tracing dominates.
+
+Runs the renderer under `python -X importtime` a few times, reports the wall time and the slowest top level
+imports, and exits with a non-zero status if the median wall time is over the budget.
+
+    python benchmarks/startup.py --budget-ms 400
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RAY_TRACER = os.path.join(ROOT, "src", "ray_tracer.py")
+
+SCENE = """\
+cam 0 0 -5 0 0 0 0 1 0 1 1
+set 0 0 0 1 1
+mtl 0.9 0.1 0.1 1 1 1 0 0 0 10 0
+sph 0 0 0 1 1
+lgt 0 5 -5 1 1 1 1 0.9 0
+"""
+
+
+def parse_importtime(stderr: str):
+    # Lines look like "import time:  self [us] | cumulative | imported package", nesting shown by indentation
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            imports.append((int(cumulative), name.strip()))
+    return imports
+
+
+def run_once(scene_path: str, output_path: str):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", RAY_TRACER, scene_path, output_path,
+         "--width", "8", "--height", "8", "--no-progress"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+    )
+    return time.perf_counter() - start, parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ray tracer startup benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='Number of renders to time')
+    parser.add_argument('--budget-ms', type=float, default=400, help='Allowed median wall time in milliseconds')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scene_path = os.path.join(tmp, "thumbnail.txt")
+        with open(scene_path, "w") as f:
+            f.write(SCENE)
+
+        runs = [run_once(scene_path, os.path.join(tmp, "thumbnail.png")) for _ in range(args.runs)]
+
+    wall_ms = statistics.median(wall for wall, _ in runs) * 1000
+    imports = sorted(runs[-1][1], reverse=True)
+    import_ms = sum(cumulative for cumulative, _ in imports) / 1000
+
+    print(f"Median wall time: {wall_ms:.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+    print(f"Top level imports: {import_ms:.1f} ms")
+    for cumulative, name in imports[:10]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    if wall_ms > args.budget_ms:
+        print("Startup budget exceeded")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
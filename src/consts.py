@@ -1 +1,17 @@
-EPSILON = 1e-9
\ No newline at end of file
+import numpy as np
+
+# Precision used for vectors, images and mesh data, along with the matching self-intersection epsilon.
+# float32 can't resolve 1e-9 offsets at scene scale, so it needs a much larger epsilon.
+PRECISIONS = {
+    "float64": (np.float64, 1e-9),
+    "float32": (np.float32, 1e-4),
+}
+
+FLOAT_DTYPE, EPSILON = PRECISIONS["float64"]
+
+
+def set_precision(name: str):
+    global FLOAT_DTYPE, EPSILON
+    if name not in PRECISIONS:
+        raise ValueError("Unknown precision: {}".format(name))
+    FLOAT_DTYPE, EPSILON = PRECISIONS[name]
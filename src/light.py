@@ -4,6 +4,7 @@ from functools import cached_property
 from typing import Generator
 import numpy as np
 
+import consts
 from scene import Scene
 from vector3 import Vector3, cross
 
@@ -42,13 +43,13 @@ class Light:
         t_data = t._data / n
         b_data = b._data / n
 
-        x_indices, y_indices = np.meshgrid(np.arange(n), np.arange(n))
+        x_indices, y_indices = np.meshgrid(np.arange(n, dtype=consts.FLOAT_DTYPE), np.arange(n, dtype=consts.FLOAT_DTYPE))
 
         x_indices = x_indices.flatten()
         y_indices = y_indices.flatten()
 
-        jitter_x = np.random.random(n * n)
-        jitter_y = np.random.random(n * n)
+        jitter_x = np.random.random(n * n).astype(consts.FLOAT_DTYPE)
+        jitter_y = np.random.random(n * n).astype(consts.FLOAT_DTYPE)
 
         total_x = (x_indices + jitter_x)[:, np.newaxis] * t_data
         total_y = (y_indices + jitter_y)[:, np.newaxis] * b_data
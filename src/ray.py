@@ -1,5 +1,4 @@
-from packaging.version import VersionComparisonMethod
-
+import consts
 from light import Light
 from ray_hit import RayHit
 from vector3 import Vector3
@@ -22,7 +21,7 @@ class Ray:
 def find_hit(ray, max_list_depth: int) -> List[RayHit]:
     hits_heap = []
 
-    for surface in Scene().surfaces:
+    for surface in Scene().candidate_surfaces(ray):
         # TODO - consider sending max t (after we fill max_list_depth) to get_hit and stop if we reached t.
         ray_hit = surface.get_hit(ray)
         if ray_hit is not None:
@@ -61,7 +60,7 @@ def trace_ray(ray, max_recursion_depth: int = 10) -> Vector3:
 
         for sample in light.samples(
                 light_vector):
-            origin = closest_hit.point + closest_hit.normal * Scene.EPSILON
+            origin = closest_hit.point + closest_hit.normal * consts.EPSILON
 
             sample_vector = sample - origin
             shadow_ray = Ray(origin, sample_vector)
@@ -87,8 +86,8 @@ def trace_ray(ray, max_recursion_depth: int = 10) -> Vector3:
 
 
 def is_occluded(ray, max_distance: float) -> bool:
-    for surface in Scene().surfaces:
+    for surface in Scene().candidate_surfaces(ray):
         hit = surface.get_hit(ray)
-        if hit is not None and hit.distance < max_distance - Scene.EPSILON:
+        if hit is not None and hit.distance < max_distance - consts.EPSILON:
             return True
     return False
\ No newline at end of file
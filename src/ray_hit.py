@@ -20,7 +20,8 @@ class RayHit:
     distance: float
 
     def __post_init__(self):
-        self.material = Scene().materials[self.material - 1]
+        if isinstance(self.material, int):
+            self.material = Scene().materials[self.material - 1]
 
     def __gt__(self, other):
         if isinstance(other, RayHit):
@@ -1,19 +1,20 @@
 import argparse
-from PIL import Image
 import numpy as np
 import os
 import sys
-import datetime
 import logging
-import tqdm
 
+import consts
 from camera import Camera
 from light import Light
 from material import Material
 from scene_settings import SceneSettings
 from surfaces.cube import Cube
+from surfaces.group import Group
 from surfaces.infinite_plane import InfinitePlane
+from surfaces.instance import Instance, transform_matrix
 from surfaces.sphere import Sphere
+from surfaces.triangle_mesh import TriangleMesh
 from vector3 import Vector3
 from ray import Ray, trace_ray
 from viewport import Viewport
@@ -22,17 +23,19 @@ from scene import Scene
 
 
 
-def setup_logger(log_level = logging.INFO):
-    os.makedirs("logs", exist_ok=True)
-    logfile = os.path.join("logs", f"{datetime.datetime.now().isoformat()}.log")
+def setup_logger(log_level = logging.INFO, logfile = None):
+    handlers = [logging.StreamHandler(sys.stdout)]
+    # File logging is opt-in, batch renders shouldn't pay for a log file each run
+    if logfile is not None:
+        log_dir = os.path.dirname(logfile)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        handlers.append(logging.FileHandler(logfile, encoding="utf8"))
     logging.basicConfig(
         level=log_level,
         format="[%(asctime)s][%(levelname)s][%(name)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(logfile, encoding="utf8")
-        ]
+        handlers=handlers
     )
 
 
@@ -41,6 +44,16 @@ def parse_scene_file(file_path):
     camera = None
     scene_settings = None
     s = Scene()
+    groups = {}
+    # Surfaces between "grp" and "end" are collected into a shared group instead of the scene
+    group_name, group_surfaces = None, None
+
+    def add_surface(surface):
+        objects.append(surface)
+        if group_surfaces is not None:
+            group_surfaces.append(surface)
+        else:
+            s.surfaces.append(surface)
 
     with open(file_path, 'r') as f:
         for line in f:
@@ -49,6 +62,29 @@ def parse_scene_file(file_path):
                 continue
             parts = line.split()
             obj_type = parts[0]
+            if obj_type == "msh":
+                # Mesh paths are relative to the scene file
+                mesh_path = os.path.join(os.path.dirname(file_path), parts[1])
+                add_surface(TriangleMesh.from_file(mesh_path, int(parts[2])))
+                continue
+            if obj_type == "grp":
+                if group_surfaces is not None:
+                    raise ValueError("Nested group: {}".format(parts[1]))
+                group_name, group_surfaces = parts[1], []
+                continue
+            if obj_type == "end":
+                if group_surfaces is None:
+                    raise ValueError("'end' without a matching 'grp'")
+                groups[group_name] = Group(group_surfaces)
+                group_name, group_surfaces = None, None
+                continue
+            if obj_type == "ins":
+                if parts[1] not in groups:
+                    raise ValueError("Unknown group: {}".format(parts[1]))
+                params = [float(p) for p in parts[2:]]
+                matrix = transform_matrix(params[:3], params[3:6], params[6:9])
+                add_surface(Instance(groups[parts[1]], matrix))
+                continue
             params = [float(p) for p in parts[1:]]
             if obj_type == "cam":
                 camera = Camera(params[:3], params[3:6], params[6:9], params[9], params[10])
@@ -61,27 +97,26 @@ def parse_scene_file(file_path):
                 objects.append(material)
                 s.materials.append(material)
             elif obj_type == "sph":
-                sphere = Sphere(params[:3], params[3], int(params[4]))
-                objects.append(sphere)
-                s.surfaces.append(sphere)
+                add_surface(Sphere(params[:3], params[3], int(params[4])))
             elif obj_type == "pln":
-                plane = InfinitePlane(params[:3], params[3], int(params[4]))
-                objects.append(plane)
-                s.surfaces.append(plane)
+                add_surface(InfinitePlane(params[:3], params[3], int(params[4])))
             elif obj_type == "box":
-                cube = Cube(params[:3], params[3], int(params[4]))
-                objects.append(cube)
-                s.surfaces.append(cube)
+                add_surface(Cube(params[:3], params[3], int(params[4])))
             elif obj_type == "lgt":
                 light = Light(params[:3], params[3:6], params[6], params[7], params[8])
                 objects.append(light)
                 s.lights.append(light)
             else:
                 raise ValueError("Unknown object type: {}".format(obj_type))
+    if group_surfaces is not None:
+        raise ValueError("Group {} is missing its 'end'".format(group_name))
     return camera, scene_settings, objects
 
 
 def save_image(image_array, path):
+    # PIL is only needed once the render is done, don't pay for it at startup
+    from PIL import Image
+
     image = Image.fromarray(np.uint8(image_array * 255))
     # Save the image to a file
     image.save(path)
@@ -93,22 +128,37 @@ def main():
     parser.add_argument('output_image', type=str, help='Name of the output image file')
     parser.add_argument('--width', type=int, default=600, help='Image width')
     parser.add_argument('--height', type=int, default=400, help='Image height')
+    parser.add_argument('--log-file', type=str, default=None, help='Also write the log to this file')
+    parser.add_argument('--no-progress', action='store_true', help='Disable the progress bar')
+    parser.add_argument('--precision', choices=sorted(consts.PRECISIONS), default='float64',
+                        help='Floating point precision used for rendering')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed, for reproducible shadow sampling')
     args = parser.parse_args()
-    setup_logger(logging.DEBUG)
+    setup_logger(logging.DEBUG, args.log_file)
     logger = logging.getLogger("Raytracer").getChild("Main")
 
     # TODO - maybe remove me
     aspect_ratio = args.width / args.height
     logger.info("Starting Raytracing, width: %d height: %d (Aspect Ratio is: %.2f)", args.width, args.height, aspect_ratio)
 
+    # Precision must be set before parsing, the scene's vectors and meshes are created in it
+    consts.set_precision(args.precision)
+    if args.seed is not None:
+        np.random.seed(args.seed)
+
     # Parse the scene file
     camera, scene_settings, objects = parse_scene_file(args.scene_file)
-    image_array = np.zeros((args.height, args.width, 3))
+    image_array = np.zeros((args.height, args.width, 3), dtype=consts.FLOAT_DTYPE)
 
     vp = Viewport(camera, args.width, args.height)
     origin = camera.get_position()
 
-    for x in tqdm.tqdm(range(args.width), desc="Rendering"):
+    columns = range(args.width)
+    if not args.no_progress:
+        import tqdm
+        columns = tqdm.tqdm(columns, desc="Rendering")
+
+    for x in columns:
         for y in range(args.height):
             target = vp.get_pixel_center(x, y)
             r = Ray(origin, target - origin)
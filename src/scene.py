@@ -1,7 +1,11 @@
 from __future__ import annotations
 from functools import cached_property
-from typing import List, Optional
+from itertools import chain
+from typing import Iterable, List, Optional
 
+import numpy as np
+
+from surfaces.bvh import BVH
 from vector3 import Vector3
 
 
@@ -21,7 +25,8 @@ class Scene(metaclass=SceneSingleton):
     lights: List['Light']
 
     # Hardcoded constants
-    EPSILON = 1e-9
+    # Above this many surfaces, ray queries only visit surfaces whose bounds the ray crosses
+    BVH_THRESHOLD = 16
 
     def __init__(self):
         self.settings = None
@@ -30,5 +35,41 @@ class Scene(metaclass=SceneSingleton):
         self.materials = []
         self.lights = []
 
+        self._bvh = None
+        self._bvh_surface_count = 0
+        self._bounded_surfaces = []
+        self._unbounded_surfaces = []
+
     def background_color(self):
         return Vector3.from_array(self.settings.background_color)
+
+    def _build_bvh(self):
+        self._bounded_surfaces = []
+        self._unbounded_surfaces = []
+        bounds = []
+        for surface in self.surfaces:
+            surface_bounds = surface.get_bounds()
+            if surface_bounds is None:
+                self._unbounded_surfaces.append(surface)
+            else:
+                self._bounded_surfaces.append(surface)
+                bounds.append(surface_bounds)
+
+        # Only the bounds of each surface are stored, instances keep their geometry shared
+        self._bvh = BVH(np.array([b[0] for b in bounds]), np.array([b[1] for b in bounds])) if bounds else None
+        self._bvh_surface_count = len(self.surfaces)
+
+    def candidate_surfaces(self, ray: 'Ray') -> Iterable['Surface']:
+        if len(self.surfaces) <= self.BVH_THRESHOLD:
+            return self.surfaces
+
+        if self._bvh_surface_count != len(self.surfaces):
+            self._build_bvh()
+        if self._bvh is None:
+            return self._unbounded_surfaces
+
+        bounded = self._bounded_surfaces
+        return chain(
+            self._unbounded_surfaces,
+            (bounded[i] for i in self._bvh.candidates(ray.origin._data, ray.direction._data))
+        )
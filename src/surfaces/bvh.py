@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Callable, Generator, Optional, Tuple
+
+import numpy as np
+
+
+class BVH:
+    """
+    Flat bounding volume hierarchy over primitive bounding boxes.
+
+    Nodes are stored depth-first in NumPy arrays: the left child of an interior node is always the next node,
+    the right child index is kept in `node_right`. Leaves reference a contiguous range of `order`, so the caller
+    can reorder its own primitive arrays once and intersect leaves as slices.
+    """
+
+    def __init__(self, bounds_min: np.ndarray, bounds_max: np.ndarray, leaf_size: int = 16):
+        count = len(bounds_min)
+        centroids = (bounds_min + bounds_max) * 0.5
+        order = np.arange(count, dtype=np.int64)
+
+        node_min, node_max = [], []
+        node_start, node_count, node_right = [], [], []
+
+        # (start, end, parent) - parent is set only for right children, which must patch their parent's link
+        stack = [(0, count, -1)]
+        while stack:
+            start, end, parent = stack.pop()
+            node = len(node_start)
+            if parent >= 0:
+                node_right[parent] = node
+
+            indices = order[start:end]
+            node_min.append(bounds_min[indices].min(axis=0))
+            node_max.append(bounds_max[indices].max(axis=0))
+            node_right.append(-1)
+
+            if end - start <= leaf_size:
+                node_start.append(start)
+                node_count.append(end - start)
+                continue
+
+            node_start.append(start)
+            node_count.append(0)
+
+            # Median split along the widest centroid axis
+            node_centroids = centroids[indices]
+            axis = int(np.argmax(node_centroids.max(axis=0) - node_centroids.min(axis=0)))
+            half = (end - start) // 2
+            order[start:end] = indices[np.argpartition(node_centroids[:, axis], half)]
+
+            # Push right first so the left child is built next and lands at node + 1
+            stack.append((start + half, end, node))
+            stack.append((start, start + half, -1))
+
+        self.order = order
+        self.node_min = np.array(node_min).reshape(-1, 3)
+        self.node_max = np.array(node_max).reshape(-1, 3)
+        self.node_start = np.array(node_start, dtype=np.int64)
+        self.node_count = np.array(node_count, dtype=np.int64)
+        self.node_right = np.array(node_right, dtype=np.int64)
+
+    @property
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.node_min[0], self.node_max[0]
+
+    def _slab(self, nodes, origin: np.ndarray, inv_dir: np.ndarray):
+        with np.errstate(invalid='ignore'):
+            t0 = (self.node_min[nodes] - origin) * inv_dir
+            t1 = (self.node_max[nodes] - origin) * inv_dir
+        # fmin/fmax skip the NaNs produced by 0 * inf on axis-parallel rays
+        t_near = np.fmin(t0, t1).max(axis=-1)
+        t_far = np.fmax(t0, t1).min(axis=-1)
+        return t_near, t_far
+
+    def closest_hit(self, origin: np.ndarray, direction: np.ndarray,
+                    intersect_leaf: Callable[[int, int, float], Optional[Tuple[float, object]]],
+                    t_min: float = 0.0) -> Optional[Tuple[float, object]]:
+        """
+        Finds the closest hit along the ray. `intersect_leaf(start, end, t_max)` intersects primitives
+        `order[start:end]` and returns `(t, payload)` for its closest hit below `t_max`, or None.
+        """
+        with np.errstate(divide='ignore'):
+            inv_dir = 1.0 / direction
+
+        t_near, t_far = self._slab(0, origin, inv_dir)
+        if t_far < max(t_near, t_min):
+            return None
+
+        best = None
+        best_t = np.inf
+        stack = [(0, t_near)]
+        while stack:
+            node, node_t_near = stack.pop()
+            if node_t_near >= best_t:
+                continue
+
+            count = self.node_count[node]
+            if count > 0:
+                start = self.node_start[node]
+                hit = intersect_leaf(start, start + count, best_t)
+                if hit is not None and hit[0] < best_t:
+                    best_t = hit[0]
+                    best = hit
+                continue
+
+            children = (node + 1, self.node_right[node])
+            t_near, t_far = self._slab(list(children), origin, inv_dir)
+            hit_mask = t_far >= np.maximum(t_near, t_min)
+
+            # Push the farther child first so the nearer one is visited next
+            for i in ((0, 1) if t_near[0] > t_near[1] else (1, 0)):
+                if hit_mask[i]:
+                    stack.append((int(children[i]), t_near[i]))
+
+        return best
+
+    def candidates(self, origin: np.ndarray, direction: np.ndarray, t_min: float = 0.0) -> Generator[int]:
+        """Yields every primitive index whose bounding box the ray passes through, in no particular order."""
+        with np.errstate(divide='ignore'):
+            inv_dir = 1.0 / direction
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            t_near, t_far = self._slab(node, origin, inv_dir)
+            if t_far < max(t_near, t_min):
+                continue
+
+            count = self.node_count[node]
+            if count > 0:
+                start = self.node_start[node]
+                yield from self.order[start:start + count].tolist()
+            else:
+                stack.append(int(self.node_right[node]))
+                stack.append(node + 1)
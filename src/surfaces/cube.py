@@ -1,9 +1,11 @@
 from typing import Optional
 
-from consts import EPSILON
+import numpy as np
+
+import consts
 from ray import Ray
 from ray_hit import RayHit
-from vector3 import Vector3, element_min, element_max
+from vector3 import Vector3, element_min, element_max, vec3_convolution
 from .surface import Surface
 
 
@@ -13,16 +15,20 @@ class Cube(Surface):
         self.scale = scale
         self.material_index = material_index
 
+    def get_bounds(self):
+        half_size = self.scale * 0.5
+        return self.position._data - half_size, self.position._data + half_size
+
     def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
-        inv_dir = ray.direction.inverse()
+        inv_dir = ray.direction.inverse
 
         half_size = self.scale * 0.5
         offset = Vector3(half_size, half_size, half_size)
         min_pt = self.position - offset
         max_pt = self.position + offset
 
-        t1 = (min_pt - ray.origin) * inv_dir
-        t2 = (max_pt - ray.origin) * inv_dir
+        t1 = vec3_convolution(min_pt - ray.origin, inv_dir)
+        t2 = vec3_convolution(max_pt - ray.origin, inv_dir)
 
         t_min_vec = element_min(t1, t2)
         t_max_vec = element_max(t1, t2)
@@ -30,20 +36,17 @@ class Cube(Surface):
         t_enter = t_min_vec.max_component()
         t_exit = t_max_vec.min_component()
 
-        if t_exit < t_enter or t_exit < EPSILON:
+        if t_exit < t_enter or t_exit < consts.EPSILON:
             return None
 
-        t = t_enter if t_enter > EPSILON else t_exit
+        t = t_enter if t_enter > consts.EPSILON else t_exit
         hit_point = ray.origin + (ray.direction * t)
 
         normal = Vector3.zero()
         diff = hit_point - self.position
 
-        if abs(diff.x / half_size) - 1 > EPSILON:
-            normal.x = -1 if diff.x < 0 else 1
-        elif abs(diff.y / half_size) - 1 > EPSILON:
-            normal.y = -1 if diff.y < 0 else 1
-        else:
-            normal.z = -1 if diff.z < 0 else 1
+        # The hit face is the axis the hit point is furthest along
+        axis = int(np.argmax(np.abs(diff._data)))
+        normal._data[axis] = -1 if diff[axis] < 0 else 1
 
         return RayHit(self, hit_point, normal, self.material_index, t)
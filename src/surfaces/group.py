@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+
+from ray import Ray
+from ray_hit import RayHit
+from .bvh import BVH
+from .surface import Surface
+
+
+class Group(Surface):
+    LEAF_SIZE = 4
+
+    def __init__(self, surfaces: List[Surface]):
+        if not surfaces:
+            raise ValueError("Group has no surfaces")
+
+        bounds = [surface.get_bounds() for surface in surfaces]
+        if any(b is None for b in bounds):
+            raise ValueError("Group can only hold bounded surfaces")
+
+        self.surfaces = surfaces
+        self._bvh = BVH(np.array([b[0] for b in bounds]), np.array([b[1] for b in bounds]), self.LEAF_SIZE)
+
+    def get_bounds(self):
+        return self._bvh.bounds
+
+    def _intersect_leaf(self, ray: 'Ray', start: int, end: int, t_max: float):
+        closest = None
+        for index in self._bvh.order[start:end]:
+            hit = self.surfaces[index].get_hit(ray)
+            if hit is not None and hit.distance < t_max:
+                t_max = hit.distance
+                closest = (hit.distance, hit)
+        return closest
+
+    def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
+        hit = self._bvh.closest_hit(
+            ray.origin._data, ray.direction._data,
+            lambda start, end, t_max: self._intersect_leaf(ray, start, end, t_max)
+        )
+        return None if hit is None else hit[1]
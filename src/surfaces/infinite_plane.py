@@ -1,6 +1,6 @@
 from typing import Optional
 
-from consts import EPSILON
+import consts
 from ray import Ray
 from ray_hit import RayHit
 from vector3 import Vector3, dot
@@ -16,11 +16,11 @@ class InfinitePlane(Surface):
 
     def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
         dprod = dot(ray.direction, self.normal)
-        if abs(dprod) < EPSILON:
+        if abs(dprod) < consts.EPSILON:
             return None
 
         t = (self.offset - dot(ray.origin, self.normal)) / dprod
-        if t < EPSILON:
+        if t < consts.EPSILON:
             return None
         hit_point = ray.origin + (ray.direction * t)
 
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from math import cos, radians, sin
+from typing import Optional
+
+import numpy as np
+
+from ray import Ray
+from ray_hit import RayHit
+from vector3 import Vector3
+from .surface import Surface
+
+
+def transform_matrix(translation, rotation, scale) -> np.ndarray:
+    """Builds translation * rotation (X, then Y, then Z, in degrees) * scale as a 4x4 matrix."""
+    rx, ry, rz = (radians(a) for a in rotation)
+
+    rot_x = np.array([[1, 0, 0], [0, cos(rx), -sin(rx)], [0, sin(rx), cos(rx)]])
+    rot_y = np.array([[cos(ry), 0, sin(ry)], [0, 1, 0], [-sin(ry), 0, cos(ry)]])
+    rot_z = np.array([[cos(rz), -sin(rz), 0], [sin(rz), cos(rz), 0], [0, 0, 1]])
+
+    matrix = np.identity(4)
+    matrix[:3, :3] = rot_z @ rot_y @ rot_x @ np.diag(scale)
+    matrix[:3, 3] = translation
+    return matrix
+
+
+class Instance(Surface):
+    def __init__(self, geometry: Surface, matrix):
+        bounds = geometry.get_bounds()
+        if bounds is None:
+            raise ValueError("Instanced geometry must be bounded")
+
+        # The geometry is shared between instances, only the transform is per instance
+        self.geometry = geometry
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self.inverse = np.linalg.inv(self.matrix)
+        self.normal_matrix = self.inverse[:3, :3].T
+
+        # World bounds are the bounds of the transformed object space box corners
+        corners = np.array([[x, y, z] for x in (bounds[0][0], bounds[1][0])
+                            for y in (bounds[0][1], bounds[1][1])
+                            for z in (bounds[0][2], bounds[1][2])])
+        corners = corners @ self.matrix[:3, :3].T + self.matrix[:3, 3]
+        self.bounds = corners.min(axis=0), corners.max(axis=0)
+
+    def get_bounds(self):
+        return self.bounds
+
+    def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
+        # The direction is transformed without normalizing, so distances along the ray stay the same in both spaces
+        origin = self.inverse[:3, :3] @ ray.origin._data + self.inverse[:3, 3]
+        direction = self.inverse[:3, :3] @ ray.direction._data
+
+        hit = self.geometry.get_hit(Ray(Vector3.from_array(origin), Vector3.from_array(direction)))
+        if hit is None:
+            return None
+
+        normal = Vector3.from_array(self.normal_matrix @ hit.normal._data).normalized
+        return RayHit(self, ray.at(hit.distance), normal, hit.material, hit.distance)
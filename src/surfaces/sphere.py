@@ -1,10 +1,10 @@
 from math import sqrt
 from typing import Optional
 
-from src.consts import EPSILON
-from src.ray import Ray
-from src.ray_hit import RayHit
-from src.vector3 import Vector3
+import consts
+from ray import Ray
+from ray_hit import RayHit
+from vector3 import Vector3
 from .surface import Surface
 import numpy as np  # Make sure numpy is imported
 
@@ -15,6 +15,9 @@ class Sphere(Surface):
         self.radius = radius
         self.material_index = material_index
 
+    def get_bounds(self):
+        return self.position._data - self.radius, self.position._data + self.radius
+
     def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
 
         O = ray.origin._data
@@ -38,9 +41,9 @@ class Sphere(Surface):
         t0 = (-b - sqrt_disc) / (2 * a)
         t1 = (-b + sqrt_disc) / (2 * a)
 
-        if t0 > EPSILON:
+        if t0 > consts.EPSILON:
             t = t0
-        elif t1 > EPSILON:
+        elif t1 > consts.EPSILON:
             t = t1
         else:
             return None
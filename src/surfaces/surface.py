@@ -1,8 +1,14 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Optional, Tuple
+
+import numpy as np
 
 
 class Surface:
     def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
         raise NotImplementedError()
 
+    def get_bounds(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        # Axis aligned (min, max) corners, None for unbounded surfaces
+        return None
+
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import os
+from array import array
+from typing import Optional, Tuple
+
+import numpy as np
+
+import consts
+from ray import Ray
+from ray_hit import RayHit
+from vector3 import Vector3
+from .bvh import BVH
+from .surface import Surface
+
+
+class TriangleMesh(Surface):
+    LEAF_SIZE = 16
+
+    def __init__(self, vertices, faces, material_index):
+        self.vertices = np.ascontiguousarray(vertices, dtype=consts.FLOAT_DTYPE).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int32).reshape(-1, 3)
+        self.material_index = material_index
+
+        if len(faces) == 0:
+            raise ValueError("Triangle mesh has no faces")
+        if faces.min() < 0 or faces.max() >= len(self.vertices):
+            raise ValueError("Triangle mesh face references a missing vertex")
+
+        corners = self.vertices[faces]
+        self._bvh = BVH(corners.min(axis=1), corners.max(axis=1), self.LEAF_SIZE)
+        del corners
+
+        # Store faces in BVH order so every leaf is a contiguous slice
+        self.faces = np.ascontiguousarray(faces[self._bvh.order])
+
+    @staticmethod
+    def from_file(path: str, material_index: int) -> TriangleMesh:
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".obj":
+            vertices, faces = _load_obj(path)
+        elif extension == ".ply":
+            vertices, faces = _load_ply(path)
+        else:
+            raise ValueError("Unsupported mesh format: {}".format(extension))
+        return TriangleMesh(vertices, faces, material_index)
+
+    def get_bounds(self):
+        return self._bvh.bounds
+
+    def _intersect_leaf(self, origin: np.ndarray, direction: np.ndarray, start: int, end: int, t_max: float):
+        tris = self.faces[start:end]
+        v0 = self.vertices[tris[:, 0]]
+        e1 = self.vertices[tris[:, 1]] - v0
+        e2 = self.vertices[tris[:, 2]] - v0
+
+        t = _moller_trumbore(origin, direction, v0, e1, e2)
+        i = int(np.argmin(t))
+        if t[i] >= t_max:
+            return None
+        return t[i], start + i
+
+    def get_hit(self, ray: 'Ray') -> Optional['RayHit']:
+        origin = ray.origin._data
+        direction = ray.direction._data
+
+        hit = self._bvh.closest_hit(
+            origin, direction,
+            lambda start, end, t_max: self._intersect_leaf(origin, direction, start, end, t_max),
+            consts.EPSILON
+        )
+        if hit is None:
+            return None
+
+        t, face = hit
+        v0, v1, v2 = self.vertices[self.faces[face]]
+        normal = Vector3.from_array(np.cross(v1 - v0, v2 - v0)).normalized
+        # Meshes are often wound inconsistently - always face the normal towards the ray
+        if normal._data @ direction > 0:
+            normal = -normal
+
+        return RayHit(self, ray.at(t), normal, self.material_index, float(t))
+
+
+def _moller_trumbore(origin: np.ndarray, direction: np.ndarray,
+                     v0: np.ndarray, e1: np.ndarray, e2: np.ndarray) -> np.ndarray:
+    # Batched Moller-Trumbore, returns the hit distance per triangle (inf on miss)
+    p = np.cross(direction, e2)
+    det = np.einsum('ij,ij->i', e1, p)
+    # No epsilon on the determinant - it scales with triangle area, so any fixed threshold drops small triangles
+    valid = det != 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_det = 1.0 / det
+        s = origin - v0
+        u = np.einsum('ij,ij->i', s, p) * inv_det
+        q = np.cross(s, e1)
+        v = (q @ direction) * inv_det
+        t = np.einsum('ij,ij->i', e2, q) * inv_det
+        valid &= (u >= 0) & (v >= 0) & (u + v <= 1) & (t > consts.EPSILON)
+
+    return np.where(valid, t, np.inf)
+
+
+def _load_obj(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    # array.array keeps the parsed data compact instead of millions of Python floats
+    vertices = array('d')
+    faces = array('i')
+
+    with open(path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "v":
+                vertices.extend(float(p) for p in parts[1:4])
+            elif parts[0] == "f":
+                vertex_count = len(vertices) // 3
+                # "f v/vt/vn ..." - only the position index matters, negative indices are relative to the end
+                indices = [int(p.split("/")[0]) for p in parts[1:]]
+                indices = [i - 1 if i > 0 else vertex_count + i for i in indices]
+                # Triangulate polygons as a fan
+                for i in range(1, len(indices) - 1):
+                    faces.extend((indices[0], indices[i], indices[i + 1]))
+
+    return np.frombuffer(vertices, dtype=np.float64).reshape(-1, 3), \
+        np.frombuffer(faces, dtype=np.int32).reshape(-1, 3)
+
+
+_PLY_TYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+
+def _load_ply(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    with open(path, 'rb') as f:
+        if f.readline().strip() != b"ply":
+            raise ValueError("Not a PLY file: {}".format(path))
+
+        fmt = None
+        elements = []  # [name, count, [(property name, dtype, list count dtype or None)]]
+        while True:
+            line = f.readline()
+            if not line:
+                raise ValueError("Unexpected end of PLY header: {}".format(path))
+            parts = line.decode("ascii").split()
+            if not parts or parts[0] in ("comment", "obj_info"):
+                continue
+            if parts[0] == "end_header":
+                break
+            if parts[0] == "format":
+                fmt = parts[1]
+            elif parts[0] == "element":
+                elements.append([parts[1], int(parts[2]), []])
+            elif parts[0] == "property":
+                if parts[1] == "list":
+                    elements[-1][2].append((parts[4], _PLY_TYPES[parts[3]], _PLY_TYPES[parts[2]]))
+                else:
+                    elements[-1][2].append((parts[2], _PLY_TYPES[parts[1]], None))
+
+        if fmt == "ascii":
+            data = _read_ply_ascii(f, elements)
+        elif fmt in ("binary_little_endian", "binary_big_endian"):
+            data = _read_ply_binary(f, elements, "<" if fmt == "binary_little_endian" else ">")
+        else:
+            raise ValueError("Unsupported PLY format: {}".format(fmt))
+
+    vertex = data["vertex"]
+    vertices = np.stack([vertex["x"], vertex["y"], vertex["z"]], axis=-1)
+
+    face = data["face"]
+    polygons = face.get("vertex_indices", face.get("vertex_index"))
+    if polygons is None:
+        raise ValueError("PLY face element has no vertex_indices property")
+    return vertices, _triangulate(polygons)
+
+
+def _triangulate(polygons) -> np.ndarray:
+    if isinstance(polygons, np.ndarray):
+        # Fast path - every face has the same number of corners
+        corners = polygons.shape[1]
+        return np.concatenate([polygons[:, [0, i, i + 1]] for i in range(1, corners - 1)])
+
+    faces = array('i')
+    for polygon in polygons:
+        for i in range(1, len(polygon) - 1):
+            faces.extend((polygon[0], polygon[i], polygon[i + 1]))
+    return np.frombuffer(faces, dtype=np.int32).reshape(-1, 3)
+
+
+def _read_ply_ascii(f, elements):
+    data = {}
+    for name, count, properties in elements:
+        columns = {prop: [] for prop, _, _ in properties}
+        for _ in range(count):
+            values = f.readline().split()
+            pos = 0
+            for prop, dtype, list_dtype in properties:
+                if list_dtype is None:
+                    columns[prop].append(float(values[pos]))
+                    pos += 1
+                else:
+                    length = int(values[pos])
+                    columns[prop].append([int(v) for v in values[pos + 1:pos + 1 + length]])
+                    pos += 1 + length
+        data[name] = {
+            prop: columns[prop] if list_dtype is not None else np.array(columns[prop])
+            for prop, _, list_dtype in properties
+        }
+    return data
+
+
+def _read_ply_binary(f, elements, endian):
+    data = {}
+    for name, count, properties in elements:
+        if all(list_dtype is None for _, _, list_dtype in properties):
+            dtype = np.dtype([(prop, endian + t) for prop, t, _ in properties])
+            records = np.frombuffer(f.read(dtype.itemsize * count), dtype=dtype, count=count)
+            data[name] = {prop: records[prop] for prop, _, _ in properties}
+            continue
+
+        if len(properties) == 1:
+            # Common case of a face element holding a single list - try reading it as fixed size records
+            prop, item_type, list_type = properties[0]
+            start = f.tell()
+            first = np.frombuffer(f.read(np.dtype(list_type).itemsize), dtype=endian + list_type)
+            if len(first):
+                length = int(first[0])
+                dtype = np.dtype([("n", endian + list_type), ("v", endian + item_type, (length,))])
+                f.seek(start)
+                buffer = f.read(dtype.itemsize * count)
+                if len(buffer) == dtype.itemsize * count:
+                    records = np.frombuffer(buffer, dtype=dtype, count=count)
+                    if np.all(records["n"] == length):
+                        data[name] = {prop: records["v"].astype(np.int32)}
+                        continue
+            f.seek(start)
+
+        columns = {prop: [] for prop, _, _ in properties}
+        for _ in range(count):
+            for prop, item_type, list_type in properties:
+                if list_type is None:
+                    columns[prop].append(_read_ply_scalar(f, endian + item_type))
+                else:
+                    length = int(_read_ply_scalar(f, endian + list_type))
+                    items = np.frombuffer(f.read(np.dtype(item_type).itemsize * length), dtype=endian + item_type)
+                    columns[prop].append(items.tolist())
+        data[name] = {
+            prop: columns[prop] if list_type is not None else np.array(columns[prop])
+            for prop, _, list_type in properties
+        }
+    return data
+
+
+def _read_ply_scalar(f, dtype):
+    dtype = np.dtype(dtype)
+    return np.frombuffer(f.read(dtype.itemsize), dtype=dtype)[0]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 import numpy as np
+
+import consts
 from typing import List, Tuple, Union
 
 
@@ -8,7 +10,7 @@ class Vector3:
 
     def __init__(self, x: float, y: float, z: float):
         # We use a numpy array for internal storage
-        self._data = np.array([x, y, z], dtype=np.float64)
+        self._data = np.array([x, y, z], dtype=consts.FLOAT_DTYPE)
 
     @property
     def x(self):
@@ -48,7 +50,7 @@ class Vector3:
         return res
 
     def __mul__(self, other: Union[int, float]):
-        if not isinstance(other, (int, float)):
+        if not isinstance(other, (int, float, np.floating)):
             raise ValueError("Can only multiply Vector3 with numeric scalar")
         res = Vector3(0, 0, 0)
         res._data = self._data * other